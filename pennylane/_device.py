@@ -156,6 +156,7 @@ class Device(abc.ABC):
 
         self.tracker = qml.Tracker()
         self.custom_expand_fn = None
+        self._stopping_condition = None
 
     def __repr__(self):
         """String representation."""
@@ -462,6 +463,10 @@ class Device(abc.ABC):
             self.pre_measure()
 
             for obs in observables:
+                if obs.return_type is None:
+                    # the observable is not returned, so there is no statistic to compute
+                    continue
+
                 if isinstance(obs, Tensor):
                     wires = [ob.wires for ob in obs.obs]
                 else:
@@ -482,7 +487,7 @@ class Device(abc.ABC):
                 elif obs.return_type is State:
                     raise qml.QuantumFunctionError("Returning the state is not supported")
 
-                elif obs.return_type is not None:
+                else:
                     raise qml.QuantumFunctionError(
                         f"Unsupported return type specified for observable {obs.name}"
                     )
@@ -602,9 +607,11 @@ class Device(abc.ABC):
         """.BooleanFn: Returns the stopping condition for the device. The returned
         function accepts a queuable object (including a PennyLane operation
         and observable) and returns ``True`` if supported by the device."""
-        return qml.BooleanFn(
-            lambda obj: not isinstance(obj, QuantumScript) and self.supports_operation(obj.name)
-        )
+        if self._stopping_condition is None:
+            self._stopping_condition = qml.BooleanFn(
+                lambda obj: not isinstance(obj, QuantumScript) and self.supports_operation(obj.name)
+            )
+        return self._stopping_condition
 
     def custom_expand(self, fn):
         """Register a custom expansion function for the device.
@@ -960,19 +967,27 @@ class Device(abc.ABC):
                 not support
         """
 
+        # capabilities() returns a fresh copy of the capabilities dictionary in most
+        # devices, so query it once rather than per operation
+        capabilities = self.capabilities()
+        supports_mid_measure = capabilities.get("supports_mid_measure", False)
+        # TODO: update when all capabilities keys changed to "supports_tensor_observables"
+        supports_tensor = capabilities.get("supports_tensor_observables", False) or capabilities.get(
+            "tensor_observables", False
+        )
+        stopping_condition = self.stopping_condition
+
         for o in queue:
             operation_name = o.name
 
-            if isinstance(o, MidMeasureMP) and not self.capabilities().get(
-                "supports_mid_measure", False
-            ):
+            if isinstance(o, MidMeasureMP) and not supports_mid_measure:
                 raise DeviceError(
                     f"Mid-circuit measurements are not natively supported on device {self.short_name}. "
                     "Apply the @qml.defer_measurements decorator to your quantum function to "
                     "simulate the application of mid-circuit measurements on this device."
                 )
 
-            if not self.stopping_condition(o):
+            if not stopping_condition(o):
                 raise DeviceError(
                     f"Gate {operation_name} not supported on device {self.short_name}"
                 )
@@ -982,10 +997,6 @@ class Device(abc.ABC):
                 o = o.obs
 
             if isinstance(o, Tensor):
-                # TODO: update when all capabilities keys changed to "supports_tensor_observables"
-                supports_tensor = self.capabilities().get(
-                    "supports_tensor_observables", False
-                ) or self.capabilities().get("tensor_observables", False)
                 if not supports_tensor:
                     raise DeviceError(
                         f"Tensor observables not supported on device {self.short_name}"
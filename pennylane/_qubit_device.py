@@ -53,6 +53,7 @@ from pennylane.measurements import (
     VnEntropyMP,
     Shots,
 )
+from pennylane.measurements.counts import _all_outcome_strings
 from pennylane.ops.qubit.observables import BasisStateProjector
 from pennylane.resource import Resources
 from pennylane.operation import operation_derivative, Operation
@@ -217,6 +218,10 @@ class QubitDevice(Device):
         """None or array[int]: stores the samples generated by the device
         *after* rotation to diagonalize the observables."""
 
+        self._validated_circuit = None
+        """None or ~.tape.QuantumTape: the last circuit accepted by check_validity,
+        so that repeated executions of the same circuit skip re-validation."""
+
     @classmethod
     def capabilities(cls):
         capabilities = super().capabilities().copy()
@@ -273,7 +278,11 @@ class QubitDevice(Device):
                 ),
             )
 
-        self.check_validity(circuit.operations, circuit.observables)
+        # validation only inspects the names and types of the circuit contents, so it
+        # can be skipped when re-executing a circuit this device already accepted
+        if circuit is not self._validated_circuit:
+            self.check_validity(circuit.operations, circuit.observables)
+            self._validated_circuit = circuit
 
         # apply all circuit operations
         self.apply(circuit.operations, rotations=self._get_diagonalizing_gates(circuit), **kwargs)
@@ -1185,27 +1194,21 @@ class QubitDevice(Device):
         """Count the occurences of bins of sampled indices and convert them to relative
         counts in order to estimate their occurence probability per bin."""
 
-        if batch_size is None:
-            prob = np.zeros((dim, num_bins), dtype=np.float64)
-            indices = indices.reshape((num_bins, bin_size))
-            # count the basis state occurrences, and construct the probability vector for each bin
-            for b, idx in enumerate(indices):
-                basis_states, counts = np.unique(idx, return_counts=True)
-                prob[basis_states, b] = counts / bin_size
-
-            return prob
-
-        prob = np.zeros((batch_size, dim, num_bins), dtype=np.float64)
-        indices = indices.reshape((batch_size, num_bins, bin_size))
+        # count the basis state occurrences for all bins (and broadcasting indices) in a
+        # single vectorized bincount by offsetting the indices of each bin into its own
+        # window of size dim
+        total_bins = num_bins if batch_size is None else batch_size * num_bins
+        indices = indices.reshape((total_bins, bin_size))
+        offsets = np.arange(total_bins)[:, None] * dim
+        counts = np.bincount((indices + offsets).ravel(), minlength=total_bins * dim)
+        prob = counts.reshape((total_bins, dim)) / bin_size
 
-        # count the basis state occurrences, and construct the probability vector
-        # for each bin and broadcasting index
-        for i, _indices in enumerate(indices):  # First iterate over broadcasting dimension
-            for b, idx in enumerate(_indices):  # Then iterate over bins dimension
-                basis_states, counts = np.unique(idx, return_counts=True)
-                prob[i, basis_states, b] = counts / bin_size
+        if batch_size is None:
+            # construct the probability vector for each bin
+            return prob.T
 
-        return prob
+        # construct the probability vector for each bin and broadcasting index
+        return prob.reshape((batch_size, num_bins, dim)).transpose((0, 2, 1))
 
     def probability(self, wires=None, shot_range=None, bin_size=None):
         """Return either the analytic probability or estimated probability of
@@ -1440,7 +1443,7 @@ class QubitDevice(Device):
             samples = np.apply_along_axis(_sample_to_str, -1, samples)
             batched_ndims = 3  # no observable was provided, batched samples will have shape (batch_size, shots, len(wires))
             if obs.all_outcomes:
-                outcomes = list(map(_sample_to_str, self.generate_basis_states(num_wires)))
+                outcomes = _all_outcome_strings(num_wires)
         elif obs.return_type is AllCounts:
             outcomes = (
                 qml.eigvals(obs)
@@ -204,10 +204,19 @@ class DefaultQubitLegacy(QubitDevice):
         self._debugger = None
 
         # Create the initial state. Internally, we store the
-        # state as an array of dimension [2]*wires.
-        self._state = self._create_basis_state(0)
+        # state as an array of dimension [2]*wires. The |0..0> state is kept
+        # around so that reset() and repeated BasisState preparations of it do
+        # not have to reallocate it on every execution; no operation mutates a
+        # state array in place.
+        self._initial_state = None
+        self._initial_state = self._create_basis_state(0)
+        self._state = self._initial_state
         self._pre_rotated_state = self._state
 
+        # cache for the flat probability vector of the current state; see analytic_probability
+        self._flat_probs = None
+        self._flat_probs_source = None
+
         self._apply_ops = {
             "PauliX": self._apply_x,
             "PauliY": self._apply_y,
@@ -224,6 +233,18 @@ class DefaultQubitLegacy(QubitDevice):
 
     @property
     def stopping_condition(self):
+        # getattr rather than a plain attribute access so that the cache is simply
+        # skipped when the property is rebound to a different class
+        cached = getattr(self, "_stopping_condition", None)
+        if cached is not None:
+            return cached
+
+        # build the union once rather than on every call to the condition; getattr for
+        # the same reason as above
+        supported_names = getattr(self, "observables", set()).union(
+            getattr(self, "operations", set())
+        )
+
         def accepts_obj(obj):
             if obj.name == "QFT" and len(obj.wires) >= 6:
                 return False
@@ -233,9 +254,10 @@ class DefaultQubitLegacy(QubitDevice):
                 # pow operations dont work with backprop or adjoint without decomposition
                 # use class name string so we don't need to use isinstance check
                 return not (obj.__class__.__name__ == "Pow" and qml.operation.is_trainable(obj))
-            return obj.name in self.observables.union(self.operations)
+            return obj.name in supported_names
 
-        return qml.BooleanFn(accepts_obj)
+        self._stopping_condition = qml.BooleanFn(accepts_obj)
+        return self._stopping_condition
 
     @functools.lru_cache()
     def map_wires(self, wires):
@@ -271,14 +293,19 @@ class DefaultQubitLegacy(QubitDevice):
     def apply(self, operations, rotations=None, **kwargs):
         rotations = rotations or []
 
-        # apply the circuit operations
-        for i, operation in enumerate(operations):
-            if i > 0 and isinstance(operation, (StatePrep, BasisState)):
-                raise DeviceError(
-                    f"Operation {operation.name} cannot be used after other Operations have already been applied "
-                    f"on a {self.short_name} device."
-                )
+        # state preparations are only allowed as the first operation; check this up
+        # front so the application loop below carries no per-operation bookkeeping
+        late_prep = next(
+            (op for op in operations[1:] if isinstance(op, (StatePrep, BasisState))), None
+        )
+        if late_prep is not None:
+            raise DeviceError(
+                f"Operation {late_prep.name} cannot be used after other Operations have already been applied "
+                f"on a {self.short_name} device."
+            )
 
+        # apply the circuit operations
+        for operation in operations:
             if isinstance(operation, StatePrep):
                 self._apply_state_vector(operation.parameters[0], operation.wires)
             elif isinstance(operation, BasisState):
@@ -330,10 +357,13 @@ class DefaultQubitLegacy(QubitDevice):
             return self._apply_global_phase(state, operation)
         wires = operation.wires
 
-        if str(operation.name) in self._apply_ops:  # cast to string because of Tensor
+        # cast to string because of Tensor; a single .get replaces the membership
+        # check plus lookup that was previously performed for every operation
+        apply_method = self._apply_ops.get(str(operation.name))
+        if apply_method is not None:
             shift = int(self._ndim(state) > self.num_wires)
             axes = [ax + shift for ax in self.wires.indices(wires)]
-            return self._apply_ops[operation.name](state, axes)
+            return apply_method(state, axes)
 
         matrix = self._asarray(self._get_unitary_matrix(operation), dtype=self.C_DTYPE)
 
@@ -711,6 +741,14 @@ class DefaultQubitLegacy(QubitDevice):
 
         Note: This function does not support broadcasted inputs yet.
         """
+        # only the |0..0> state is kept around, so that iterating over many distinct
+        # data-dependent basis preparations does not pin a 2**num_wires array each
+        if index == 0 and self._initial_state is not None:
+            # re-run the conversion so the cached state lands on the active framework
+            # device, e.g. when DefaultQubitTorch switches between CPU and GPU
+            # parameters between executions; this is a no-op for matching devices
+            return self._asarray(self._initial_state, dtype=self.C_DTYPE)
+
         state = np.zeros(2**self.num_wires, dtype=np.complex128)
         state[index] = 1
         state = self._asarray(state, dtype=self.C_DTYPE)
@@ -938,22 +976,29 @@ class DefaultQubitLegacy(QubitDevice):
         """Reset the device"""
         super().reset()
 
-        # init the state vector to |00..0>
-        self._state = self._create_basis_state(0)
+        # init the state vector to |00..0>, reusing the cached initial state
+        self._state = self._initial_state
         self._pre_rotated_state = self._state
 
     def analytic_probability(self, wires=None):
         if self._state is None:
             return None
 
-        dim = 2**self.num_wires
-        batch_size = self._get_batch_size(self._state, [2] * self.num_wires, dim)
-        flat_state = self._reshape(
-            self._state, (batch_size, dim) if batch_size is not None else (dim,)
-        )
-        real_state = self._real(flat_state)
-        imag_state = self._imag(flat_state)
-        return self.marginal_prob(real_state**2 + imag_state**2, wires)
+        # When several observables are measured on the same state, each of them
+        # marginalizes the same probability vector. Cache the flat probabilities of the
+        # current state so that the full state vector is only traversed once instead of
+        # once per measured observable.
+        if self._flat_probs_source is not self._state:
+            dim = 2**self.num_wires
+            batch_size = self._get_batch_size(self._state, [2] * self.num_wires, dim)
+            flat_state = self._reshape(
+                self._state, (batch_size, dim) if batch_size is not None else (dim,)
+            )
+            real_state = self._real(flat_state)
+            imag_state = self._imag(flat_state)
+            self._flat_probs = real_state**2 + imag_state**2
+            self._flat_probs_source = self._state
+        return self.marginal_prob(self._flat_probs, wires)
 
     def classical_shadow(self, obs, circuit):
         """
@@ -14,7 +14,7 @@
 """Functions to apply an operation to a state vector."""
 # pylint: disable=unused-argument
 
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from string import ascii_letters as alphabet
 import numpy as np
 
@@ -57,6 +57,35 @@ def _get_slice(index, axis, num_axes):
     return tuple(idx)
 
 
+@lru_cache
+def _get_einsum_indices(wires: tuple, total_indices: int) -> str:
+    """Compute the einsum subscripts for applying a matrix to the given state indices.
+
+    The subscripts only depend on the wires of the operator and the number of state
+    indices, so they are cached to avoid rebuilding the same strings on every gate
+    application.
+
+    Args:
+        wires (tuple[int]): wires of the operator to apply
+        total_indices (int): number of indices of the (unbatched) state
+
+    Returns:
+        str: einsum subscripts of the form ``"...ed,...abc->...aec"``
+    """
+    num_indices = len(wires)
+
+    state_indices = alphabet[:total_indices]
+    affected_indices = "".join(alphabet[i] for i in wires)
+
+    new_indices = alphabet[total_indices : total_indices + num_indices]
+
+    new_state_indices = state_indices
+    for old, new in zip(affected_indices, new_indices):
+        new_state_indices = new_state_indices.replace(old, new)
+
+    return f"...{new_indices}{affected_indices},...{state_indices}->...{new_state_indices}"
+
+
 def apply_operation_einsum(op: qml.operation.Operator, state, is_state_batched: bool = False):
     """Apply ``Operator`` to ``state`` using ``einsum``. This is more efficent at lower qubit
     numbers.
@@ -74,18 +103,7 @@ def apply_operation_einsum(op: qml.operation.Operator, state, is_state_batched:
     total_indices = len(state.shape) - is_state_batched
     num_indices = len(op.wires)
 
-    state_indices = alphabet[:total_indices]
-    affected_indices = "".join(alphabet[i] for i in op.wires)
-
-    new_indices = alphabet[total_indices : total_indices + num_indices]
-
-    new_state_indices = state_indices
-    for old, new in zip(affected_indices, new_indices):
-        new_state_indices = new_state_indices.replace(old, new)
-
-    einsum_indices = (
-        f"...{new_indices}{affected_indices},...{state_indices}->...{new_state_indices}"
-    )
+    einsum_indices = _get_einsum_indices(tuple(op.wires), total_indices)
 
     new_mat_shape = [2] * (num_indices * 2)
     dim = 2**num_indices
@@ -78,6 +78,13 @@ def _accepted_operator(op: qml.operation.Operator) -> bool:
     return op.has_matrix
 
 
+def _accepted_observable(obs: qml.operation.Operator) -> bool:
+    """Specify whether or not an observable is supported by the device."""
+    if isinstance(obs, Tensor):
+        return all(o.name in _observables for o in obs.obs)
+    return obs.name in _observables
+
+
 def _accepted_adjoint_operator(op: qml.operation.Operator) -> bool:
     """Specify whether or not an Oeprator is supported by adjoint differentiation."""
     return op.num_params == 0 or op.num_params == 1 and op.has_generator
@@ -180,9 +187,9 @@ def validate_multiprocessing_workers(
                 break
         num_threads = threads_per_proc * max_workers
         num_cpu = os.cpu_count()
-        num_threads_suggest = max(1, os.cpu_count() // max_workers)
-        num_workers_suggest = max(1, os.cpu_count() // threads_per_proc)
         if num_threads > num_cpu:
+            num_threads_suggest = max(1, num_cpu // max_workers)
+            num_workers_suggest = max(1, num_cpu // threads_per_proc)
             warnings.warn(
                 f"""The device requested {num_threads} threads ({max_workers} processes
                 times {threads_per_proc} threads per process), but the processor only has
@@ -378,10 +385,7 @@ def expand_fn(tape: qml.tape.QuantumTape) -> (Sequence[qml.tape.QuantumTape], Ca
         tape = qml.tape.QuantumScript(prep_op + new_ops, tape.measurements, shots=tape.shots)
 
     for observable in tape.observables:
-        if isinstance(observable, Tensor):
-            if any(o.name not in _observables for o in observable.obs):
-                raise DeviceError(f"Observable {observable} not supported on DefaultQubit")
-        elif observable.name not in _observables:
+        if not _accepted_observable(observable):
             raise DeviceError(f"Observable {observable} not supported on DefaultQubit")
 
     def null_postprocessing(results):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Functions to sample a state."""
+from functools import lru_cache
 from typing import List, Union
 
 import numpy as np
@@ -342,6 +343,36 @@ def _measure_sum_with_samples(
     return [unsqueezed_results] if shots.has_partitioned_shots else [unsqueezed_results[0]]
 
 
+# the basis-state labels grow as 2**num_wires, so only cache them while they are
+# small; a one-off wide sample should not pin a multi-GB array for the process
+_BASIS_STATES_CACHE_MAX_WIRES = 20
+
+
+@lru_cache
+def _cached_basis_states(num_wires: int):
+    return np.arange(2**num_wires)
+
+
+def _get_basis_states_and_powers(num_wires: int):
+    """Compute the basis-state labels and bit powers used to convert samples to binary.
+
+    Both arrays only depend on the number of sampled wires, so they are cached and
+    shared between calls for modest wire counts; callers must not modify them in
+    place.
+    """
+    if num_wires > _BASIS_STATES_CACHE_MAX_WIRES:
+        basis_states = np.arange(2**num_wires)
+    else:
+        basis_states = _cached_basis_states(num_wires)
+    return basis_states, _get_powers_of_two(num_wires)
+
+
+@lru_cache
+def _get_powers_of_two(num_wires: int):
+    """Compute the bit powers used to convert base-ten samples to binary arrays."""
+    return 1 << np.arange(num_wires, dtype=np.int64)[::-1]
+
+
 def sample_state(
     state,
     shots: int,
@@ -379,7 +410,7 @@ def sample_state(
 
     wires_to_sample = wires or state_wires
     num_wires = len(wires_to_sample)
-    basis_states = np.arange(2**num_wires)
+    basis_states, powers_of_two = _get_basis_states_and_powers(num_wires)
 
     flat_state = flatten_state(state, total_indices)
     probs = qml.probs(wires=wires_to_sample).process_state(flat_state, state_wires)
@@ -390,7 +421,6 @@ def sample_state(
     else:
         samples = rng.choice(basis_states, shots, p=probs)
 
-    powers_of_two = 1 << np.arange(num_wires, dtype=np.int64)[::-1]
     states_sampled_base_ten = samples[..., None] & powers_of_two
     return (states_sampled_base_ten > 0).astype(np.int64)
 
@@ -428,7 +458,7 @@ def _sample_state_jax(
 
     wires_to_sample = wires or state_wires
     num_wires = len(wires_to_sample)
-    basis_states = np.arange(2**num_wires)
+    basis_states, powers_of_two = _get_basis_states_and_powers(num_wires)
 
     flat_state = flatten_state(state, total_indices)
     probs = qml.probs(wires=wires_to_sample).process_state(flat_state, state_wires)
@@ -448,6 +478,5 @@ def _sample_state_jax(
     else:
         samples = jax.random.choice(key, basis_states, shape=(shots,), p=probs)
 
-    powers_of_two = 1 << np.arange(num_wires, dtype=np.int64)[::-1]
     states_sampled_base_ten = samples[..., None] & powers_of_two
     return (states_sampled_base_ten > 0).astype(np.int64)
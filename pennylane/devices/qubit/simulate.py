@@ -13,6 +13,9 @@
 # limitations under the License.
 """Simulate a quantum script."""
 # pylint: disable=protected-access
+from functools import reduce
+
+import numpy as np
 from numpy.random import default_rng
 
 import pennylane as qml
@@ -46,6 +49,64 @@ INTERFACE_TO_LIKE = {
 }
 
 
+# minimum number of operation wires for which fusing single-qubit gates pays off;
+# below this size the cost of the extra matrix products outweighs the saved state updates
+_FUSION_MIN_NUM_WIRES = 14
+
+
+def _is_fusable(op):
+    """Determine whether an operation can take part in single-qubit gate fusion.
+
+    Only unbatched single-qubit gates with a matrix and vanilla NumPy parameters
+    qualify; anything else (multi-qubit gates, trainable or interface parameters,
+    snapshots, mid-circuit measurements, ...) acts as a fusion barrier.
+    """
+    return (
+        len(op.wires) == 1
+        and op.batch_size is None
+        and op.has_matrix
+        and qml.math.get_interface(*op.data) == "numpy"
+    )
+
+
+def _fuse_single_qubit_operations(operations):
+    """Fuse runs of consecutive single-qubit gates acting on the same wire.
+
+    Each run is collapsed into a single :class:`~.QubitUnitary` whose matrix is the
+    product of the individual gate matrices, so that long circuits trigger one state
+    update per run instead of one per gate.
+
+    Args:
+        operations (list[.Operator]): the operations to fuse
+
+    Returns:
+        list[.Operator]: the operations with each fusable run replaced by a single gate
+    """
+    new_operations = []
+    run = []
+
+    def _flush_run():
+        if len(run) > 1:
+            matrix = reduce(np.matmul, [op.matrix() for op in reversed(run)])
+            new_operations.append(qml.QubitUnitary(matrix, wires=run[0].wires))
+        else:
+            new_operations.extend(run)
+        run.clear()
+
+    for op in operations:
+        if not _is_fusable(op):
+            _flush_run()
+            new_operations.append(op)
+        elif run and run[0].wires != op.wires:
+            _flush_run()
+            run.append(op)
+        else:
+            run.append(op)
+    _flush_run()
+
+    return new_operations
+
+
 def expand_state_over_wires(state, state_wires, all_wires, is_state_batched):
     """
     Expand and re-order a state given some initial and target wire orders, setting
@@ -109,7 +170,10 @@ def get_final_state(circuit, debugger=None, interface=None):
 
     # initial state is batched only if the state preparation (if it exists) is batched
     is_state_batched = bool(prep and prep.batch_size is not None)
-    for op in circuit.operations[bool(prep) :]:
+    operations = circuit.operations[bool(prep) :]
+    if len(circuit.op_wires) >= _FUSION_MIN_NUM_WIRES:
+        operations = _fuse_single_qubit_operations(operations)
+    for op in operations:
         state = apply_operation(op, state, is_state_batched=is_state_batched, debugger=debugger)
 
         # new state is batched if i) the old state is batched, or ii) the new op adds a batch dim
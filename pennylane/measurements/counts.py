@@ -15,6 +15,7 @@
 This module contains the qml.counts measurement.
 """
 import warnings
+from functools import lru_cache
 from typing import Sequence, Tuple, Optional
 
 import pennylane as qml
@@ -30,6 +31,16 @@ def _sample_to_str(sample):
     return "".join(map(str, sample))
 
 
+@lru_cache
+def _all_outcome_strings(num_wires):
+    """All basis-state strings for the given number of wires, e.g. ``('00', '01', '10', '11')``.
+
+    Building them is exponential in the number of wires, so the result is cached and
+    shared between all-outcomes counts measurements.
+    """
+    return tuple(map(_sample_to_str, qml.QubitDevice.generate_basis_states(num_wires)))
+
+
 def counts(op=None, wires=None, all_outcomes=False) -> "CountsMP":
     r"""Sample from the supplied observable, with the number of shots
     determined from the ``dev.shots`` attribute of the corresponding device,
@@ -298,9 +309,7 @@ class CountsMP(SampleMeasurement):
             batched_ndims = 3  # no observable was provided, batched samples will have shape (batch_size, shots, len(wires))
             if self.all_outcomes:
                 num_wires = len(self.wires) if len(self.wires) > 0 else shape[-1]
-                outcomes = list(
-                    map(_sample_to_str, qml.QubitDevice.generate_basis_states(num_wires))
-                )
+                outcomes = _all_outcome_strings(num_wires)
         elif self.all_outcomes:
             outcomes = qml.eigvals(self.obs)
 
@@ -17,6 +17,7 @@ arithmetic operations on their input states.
 """
 # pylint:disable=abstract-method,arguments-differ,protected-access
 from copy import copy
+from functools import lru_cache
 
 import numpy as np
 
@@ -99,6 +100,7 @@ class QubitCarry(Operation):
     """int: Number of trainable parameters that the operator depends on."""
 
     @staticmethod
+    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -245,6 +247,7 @@ class QubitSum(Operation):
         return super().label(decimals=decimals, base_label=base_label or "Σ", cache=cache)
 
     @staticmethod
+    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -1261,6 +1261,7 @@ class ECR(Operation):
     num_params = 0
 
     @staticmethod
+    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
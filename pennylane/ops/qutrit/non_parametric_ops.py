@@ -16,6 +16,8 @@ This submodule contains the qutrit quantum operations
 that do not depend on any parameters.
 """
 # pylint:disable=arguments-differ
+from functools import lru_cache
+
 import numpy as np
 
 from pennylane.operation import Operation, AdjointUndefinedError
@@ -53,6 +55,7 @@ class TShift(Operation):
     """int: Number of trainable parameters that the operator depends on."""
 
     @staticmethod
+    @lru_cache()
     def compute_matrix():
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -134,6 +137,7 @@ class TClock(Operation):
     """int: Number of trainable parameters that the operator depends on."""
 
     @staticmethod
+    @lru_cache()
     def compute_matrix():
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -223,6 +227,7 @@ class TAdd(Operation):
     """int: Number of trainable parameters that the operator depends on."""
 
     @staticmethod
+    @lru_cache()
     def compute_matrix():
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
@@ -330,6 +335,7 @@ class TSWAP(Operation):
         return base_label or "TSWAP"
 
     @staticmethod
+    @lru_cache()
     def compute_matrix():  # pylint: disable=arguments-differ
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
 
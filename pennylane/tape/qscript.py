@@ -17,7 +17,6 @@ executed by a device.
 """
 # pylint: disable=too-many-instance-attributes, protected-access, too-many-public-methods
 
-import contextlib
 import copy
 import warnings
 from collections import Counter
@@ -210,6 +209,7 @@ class QuantumScript:
         self._trainable_params = []
         self._graph = None
         self._specs = None
+        self._standard_wires_circuit = None
         self._output_dim = 0
         self._batch_size = None
         self._qfunc_output = None
@@ -384,8 +384,10 @@ class QuantumScript:
             for observable in self.observables:
                 # some observables do not have diagonalizing gates,
                 # in which case we just don't append any
-                with contextlib.suppress(qml.operation.DiagGatesUndefinedError):
+                try:
                     rotation_gates.extend(observable.diagonalizing_gates())
+                except qml.operation.DiagGatesUndefinedError:
+                    pass
         return rotation_gates
 
     @property
@@ -418,6 +420,7 @@ class QuantumScript:
         """Update all internal metadata regarding processed operations and observables"""
         self._graph = None
         self._specs = None
+        self._standard_wires_circuit = None
         self._update_circuit_info()  # Updates wires, num_wires, is_sampled, all_sampled; O(ops+obs)
         self._update_par_info()  # Updates _par_info; O(ops+obs)
 
@@ -1198,7 +1201,12 @@ class QuantumScript:
         >>> qml.devices.qubit.map_circuit_to_standard_wires(circuit) is circuit
         True
 
+        The mapped circuit is cached, so repeated calls resolve the wire order once
+        instead of re-walking all operations and measurements on every call.
         """
+        if self._standard_wires_circuit is not None:
+            return self._standard_wires_circuit
+
         op_wires = Wires.all_wires(op.wires for op in self.operations)
         meas_wires = Wires.all_wires(mp.wires for mp in self.measurements)
         num_op_wires = len(op_wires)
@@ -1206,10 +1214,12 @@ class QuantumScript:
         if set(op_wires) == set(range(num_op_wires)) and meas_only_wires == set(
             range(num_op_wires, num_op_wires + len(meas_only_wires))
         ):
-            return self
+            self._standard_wires_circuit = self
+        else:
+            wire_map = {w: i for i, w in enumerate(op_wires + meas_only_wires)}
+            self._standard_wires_circuit = qml.map_wires(self, wire_map)
 
-        wire_map = {w: i for i, w in enumerate(op_wires + meas_only_wires)}
-        return qml.map_wires(self, wire_map)
+        return self._standard_wires_circuit
 
 
 def make_qscript(fn, shots: Optional[Union[int, Sequence, Shots]] = None):
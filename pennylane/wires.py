@@ -99,6 +99,10 @@ class Wires(Sequence):
          wires (Any): the wire label(s)
     """
 
+    # Wires objects are small and created in large numbers, so avoid the
+    # per-instance ``__dict__`` and go through C-level slot access instead
+    __slots__ = ("_labels", "_hash")
+
     def __init__(self, wires, _override=False):
         if _override:
             self._labels = wires
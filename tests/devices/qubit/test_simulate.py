@@ -19,6 +19,7 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.devices.qubit import simulate, get_final_state, measure_final_state
+from pennylane.devices.qubit.simulate import _fuse_single_qubit_operations
 
 
 class TestCurrentlyUnsupportedCases:
@@ -1103,3 +1104,47 @@ class TestQInfoMeasurements:
 
         grad5 = grad_tape.jacobian(results[5], phi)
         assert qml.math.allclose(grad5, expected_grads[5])
+
+
+class TestSingleQubitFusion:
+    """Tests for the single-qubit gate fusion pre-pass used by get_final_state."""
+
+    def test_consecutive_gates_on_same_wire_are_fused(self):
+        """Test that a run of single-qubit gates on one wire becomes one QubitUnitary."""
+        ops = [qml.RX(0.1, wires=0), qml.RY(0.2, wires=0), qml.Hadamard(0), qml.CNOT((0, 1))]
+        fused = _fuse_single_qubit_operations(ops)
+
+        assert len(fused) == 2
+        assert isinstance(fused[0], qml.QubitUnitary)
+        assert fused[0].wires == qml.wires.Wires(0)
+        assert qml.equal(fused[1], qml.CNOT((0, 1)))
+
+        expected = (
+            qml.Hadamard.compute_matrix() @ qml.RY.compute_matrix(0.2) @ qml.RX.compute_matrix(0.1)
+        )
+        assert qml.math.allclose(fused[0].matrix(), expected)
+
+    def test_gates_on_different_wires_are_not_fused(self):
+        """Test that gates acting on different wires act as fusion barriers."""
+        ops = [qml.RX(0.1, wires=0), qml.RY(0.2, wires=1), qml.RZ(0.3, wires=0)]
+        fused = _fuse_single_qubit_operations(ops)
+        assert fused == ops
+
+    @pytest.mark.autograd
+    def test_trainable_parameters_are_not_fused(self):
+        """Test that gates with interface parameters act as fusion barriers."""
+        phi = qml.numpy.array(0.5, requires_grad=True)
+        ops = [qml.RX(phi, wires=0), qml.RY(0.2, wires=0)]
+        fused = _fuse_single_qubit_operations(ops)
+        assert fused == ops
+
+    def test_large_circuit_gives_same_results(self):
+        """Test that a circuit wide enough to trigger fusion gives the expected results."""
+        num_wires = 14
+        phi = 0.928
+        ops = [qml.Hadamard(w) for w in range(num_wires)]
+        ops += [qml.RZ(phi, wires=0), qml.Hadamard(0)]
+        qs = qml.tape.QuantumScript(ops, [qml.expval(qml.PauliZ(0))])
+
+        result = simulate(qs)
+        assert qml.math.allclose(result, np.cos(phi))
@@ -1179,6 +1179,20 @@ class TestExecution:
             node_3(0.12)
         assert dev_1.num_executions == num_evals_1 + num_evals_3
 
+    def test_validation_cached_per_circuit(self, mocker):
+        """Test that re-executing the same circuit only validates it once."""
+        dev = qml.device("default.qubit.legacy", wires=2)
+        spy = mocker.spy(dev, "check_validity")
+
+        tape = qml.tape.QuantumScript([qml.RX(0.5, 0)], [qml.expval(qml.PauliZ(0))])
+        dev.execute(tape)
+        dev.execute(tape)
+        assert spy.call_count == 1
+
+        other_tape = qml.tape.QuantumScript([qml.RY(0.5, 0)], [qml.expval(qml.PauliZ(0))])
+        dev.execute(other_tape)
+        assert spy.call_count == 2
+
     # pylint: disable=protected-access
     def test_get_diagonalizing_gates(self, mock_qubit_device):
         """Test the private _get_diagonalizing_gates helper method."""